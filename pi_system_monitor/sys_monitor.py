@@ -1,16 +1,233 @@
 import os
+import shutil
 import subprocess
 import psutil
 import time
 import asyncio
-from threading import Thread
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import methodcaller
+from typing import Any, Callable, NamedTuple
 from typing import Optional, Dict, List, Tuple
 import logging
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only get_per_core_cpu_usage_np needs it
+    np = None
+
+try:
+    import liburing
+except ImportError:  # liburing is optional; without it sysfs files are read with os.pread
+    liburing = None
+
 # Configure logging
 logging.basicConfig(level=logging.ERROR)
 
+CPU_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
+GPU_TEMP_PATH = "/sys/class/thermal/thermal_zone1/temp"
+NET_DEV_PATH = "/proc/net/dev"
+PROC_STAT_PATH = "/proc/stat"
+
+# Byte conversion factors; multiplying is cheaper than dividing on every call
+_INV_MB = 1.0 / (1024 ** 2)
+_INV_GB = 1.0 / (1024 ** 3)
+
+# Time-to-live in seconds for memoized psutil results
+FAST_METRIC_TTL = 1.0  # usage, frequency, memory, disk
+CPU_SAMPLE_TTL = 0.05  # one /proc/stat read serves aggregate and per-core usage within this window
+
+
+class CpuStats(NamedTuple):
+    """
+    CPU time percentages.
+    """
+    user: float
+    system: float
+    idle: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return self._asdict()
+
+
+class MemoryInfo(NamedTuple):
+    """
+    Memory usage in MB, plus the usage percentage.
+    """
+    total: float
+    used: float
+    free: float
+    percent: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return self._asdict()
+
+
+class DiskUsage(NamedTuple):
+    """
+    Disk usage in GB, plus the usage percentage.
+    """
+    total: float
+    used: float
+    free: float
+    percent: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return self._asdict()
+
+
+class BatteryStatus(NamedTuple):
+    """
+    Battery charge percentage, seconds left and whether power is plugged in.
+    """
+    percent: float
+    secsleft: float
+    power_plugged: bool
+
+    def as_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def _open_sysfs(path: str) -> int:
+    """
+    Opens a sysfs or procfs file read-only and returns its descriptor, or -1 if the file is not available.
+    """
+    try:
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return -1
+
+
+def _pread_all(fd: int, chunk_size: int = 4096) -> bytes:
+    """
+    Reads a pre-opened sysfs or procfs file from offset 0 to EOF.
+    """
+    data = os.pread(fd, chunk_size, 0)
+    if len(data) < chunk_size:
+        return data
+    chunks = [data]
+    offset = len(data)
+    while True:
+        chunk = os.pread(fd, chunk_size, offset)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+
+def _parse_proc_stat(data: bytes) -> List[Tuple[int, int]]:
+    """
+    Parses the `cpu` lines of /proc/stat into (busy, total) jiffies, aggregate first, then one entry per core.
+    """
+    times = []
+    for line in data.splitlines():
+        if not line.startswith(b'cpu'):
+            break
+        # user nice system idle iowait irq softirq steal guest guest_nice
+        fields = [int(field) for field in line.split()[1:]]
+        # guest and guest_nice are already counted in user and nice
+        total = sum(fields) - sum(fields[8:10])
+        times.append((total - fields[3] - fields[4], total))
+    return times
+
+
+def _busy_percent(previous: Tuple[int, int], current: Tuple[int, int]) -> float:
+    """
+    Returns the busy percentage between two (busy, total) samples, matching psutil.cpu_percent.
+    """
+    busy_delta = current[0] - previous[0]
+    total_delta = current[1] - previous[1]
+    if busy_delta <= 0 or total_delta <= 0:
+        return 0.0
+    return round(min(100.0, busy_delta / total_delta * 100), 1)
+
+
+def _parse_proc_net_dev(data: bytes) -> Dict[str, Tuple[int, int]]:
+    """
+    Parses /proc/net/dev into {interface: (bytes_sent, bytes_recv)}.
+    """
+    network_data = {}
+    # Skip the two header lines; fields are rx_bytes ... (8 rx columns) tx_bytes ...
+    for line in data.splitlines()[2:]:
+        # Large counters can run into the colon, e.g. b"eth0:123 ...", so split on it rather than whitespace
+        name, counters = line.split(b':', 1)
+        fields = counters.split()
+        network_data[name.strip().decode()] = (int(fields[8]), int(fields[0]))
+    return network_data
+
+
+class _IoUringBatchReader:
+    """
+    Reads a fixed set of small, pre-opened sysfs files with a single io_uring submission.
+
+    The descriptors and read buffers are registered with the ring, so a sweep over N files costs one
+    `io_uring_enter` instead of N `pread` calls and the kernel does not pin pages per request. Reads are
+    flagged `IOSQE_ASYNC` so they are punted to io_uring workers instead of running inline in the
+    submitting thread. Requires the optional `liburing` package and Linux 5.6 or newer.
+    """
+    def __init__(self, fds: List[int], size: int = 32):
+        self._count = len(fds)
+        self._lock = threading.Lock()
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(max(self._count, 1), self._ring)
+        # One fixed buffer per file; buffer index i belongs to file index i
+        self._buffers = [bytearray(size) for _ in fds]
+        self._views = [memoryview(buf) for buf in self._buffers]
+        try:
+            # Hold on to the FileIndex and Iovec while they are registered
+            self._files = liburing.FileIndex(fds)
+            liburing.io_uring_register_files(self._ring, self._files)
+            self._iovecs = liburing.Iovec(self._buffers)
+            liburing.io_uring_register_buffers(self._ring, self._iovecs)
+        except Exception:
+            liburing.io_uring_queue_exit(self._ring)
+            raise
+        self._flags = liburing.IOSQE_FIXED_FILE | liburing.IOSQE_ASYNC
+        self._closed = False
+
+    def read_all(self) -> List[Optional[int]]:
+        """
+        Reads every registered file from offset 0 and parses its integer contents.
+
+        The values are parsed while the lock is held, since the registered buffers are reused by the next call.
+
+        Returns:
+            List[Optional[int]]: The integer value of each file in registration order, or None
+            for a file whose read or parse failed.
+        """
+        with self._lock:
+            for index, buf in enumerate(self._buffers):
+                sqe = liburing.io_uring_get_sqe(self._ring)
+                liburing.io_uring_prep_read_fixed(sqe, index, buf, index, 0)
+                liburing.io_uring_sqe_set_flags(sqe, self._flags)
+                liburing.io_uring_sqe_set_data64(sqe, index)
+            liburing.io_uring_submit_and_wait(self._ring, self._count)
+            results: List[Optional[int]] = [None] * self._count
+            for _ in range(self._count):
+                # Take one completion at a time: cqe[0] is the CQ head, whereas indexing past it
+                # would walk off the end of the ring when a batch wraps around
+                liburing.io_uring_wait_cqe(self._ring, self._cqe)
+                cqe = self._cqe[0]
+                # Completions may arrive out of order; user_data carries the slot index
+                index, res = cqe.user_data, cqe.res
+                liburing.io_uring_cq_advance(self._ring, 1)
+                if res >= 0:
+                    try:
+                        results[index] = int(self._views[index][:res])
+                    except ValueError:
+                        pass
+            return results
+
+    def close(self) -> None:
+        """
+        Tears down the ring and unregisters the files.
+        """
+        if not self._closed:
+            self._closed = True
+            liburing.io_uring_queue_exit(self._ring)
+
 class SystemMonitor:
     """
     A class for monitoring system metrics such as CPU temperature, usage, memory stats, and more.
@@ -24,11 +241,32 @@ class SystemMonitor:
     Note:
         Some methods may return `None` if the metric is not available on the system.
     """
+    # Metric name -> getter method name, used by get_metrics. Names rather than functions,
+    # so subclass overrides and instance patches are honoured.
+    _METRIC_DISPATCH: Dict[str, str] = {
+        'cpu_temp': 'get_cpu_temperature',
+        'gpu_temp': 'get_gpu_temperature',
+        'cpu_usage': 'get_cpu_usage',
+        'per_core_usage': 'get_per_core_cpu_usage',
+        'cpu_freq': 'get_cpu_frequency',
+        'cpu_stats': 'get_cpu_stats',
+        'memory': 'get_memory_info',
+        'disk': 'get_disk_usage',
+        'network': 'get_network_stats',
+        'uptime': 'get_uptime',
+        'load_avg': 'get_load_average',
+        'process_count': 'get_process_count',
+        'battery': 'get_battery_status',
+    }
+
     @property
     def cpu_temperature(self) -> Optional[float]:
-        current_time = time.time()
+        """
+        The CPU temperature in Celsius, re-read from sysfs at most once every `_cpu_temp_ttl` seconds.
+        """
+        current_time = time.monotonic()
         if (current_time - self._cpu_temp_timestamp) > self._cpu_temp_ttl:
-            self._cpu_temperature = self.get_cpu_temperature()
+            self._cpu_temperature = self._read_cpu_temperature()
             self._cpu_temp_timestamp = current_time
         return self._cpu_temperature
 
@@ -36,58 +274,201 @@ class SystemMonitor:
 
     def __init__(self):
         self._cpu_temperature = None
-        self._cpu_temp_timestamp = 0
+        self._cpu_temp_timestamp = float('-inf')  # monotonic clock may be near zero right after boot
         self._cpu_temp_ttl = 5  # Time-to-live in seconds
+        # sysfs temperature files are opened once and re-read with pread from offset 0
+        self._cpu_temp_fd = _open_sysfs(CPU_TEMP_PATH)
+        self._gpu_temp_fd = _open_sysfs(GPU_TEMP_PATH)
+        self._net_dev_fd = _open_sysfs(NET_DEV_PATH)
+        # /proc/net/dev is a seq_file read in chunks; a concurrent pread from offset 0 would restart
+        # the iterator mid-read, so reads through the shared descriptor are serialized
+        self._net_dev_lock = threading.Lock()
+        # CPU usage is computed from one /proc/stat read shared by the aggregate and per-core getters;
+        # prime the baseline now so the first call does not return 0.0
+        self._stat_fd = _open_sysfs(PROC_STAT_PATH)
+        self._cpu_lock = threading.Lock()
+        self._cpu_sample: Optional[Tuple[float, float, List[float]]] = None
+        self._cpu_prev_times: List[Tuple[int, int]] = []
+        if self._stat_fd >= 0:
+            self._cpu_prev_times = _parse_proc_stat(_pread_all(self._stat_fd))
+        else:
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(interval=None, percpu=True)
+        # vcgencmd is only needed when thermal_zone1 is missing; resolve it once and
+        # throttle the fork+exec with the same TTL as the CPU temperature
+        self._vcgencmd_path = shutil.which("vcgencmd") if self._gpu_temp_fd < 0 else None
+        if self._gpu_temp_fd < 0 and self._vcgencmd_path is None:
+            logging.info("GPU temperature not available: no thermal_zone1 and no vcgencmd.")
+        self._gpu_temperature = None
+        self._gpu_temp_timestamp = float('-inf')
+        self._gpu_temp_ttl = 5  # Time-to-live in seconds
+        # Batch the sysfs temperature reads of get_all_metrics through io_uring when available
+        self._sysfs_reader = None
+        self._sysfs_slots = [fd for fd in (self._cpu_temp_fd, self._gpu_temp_fd) if fd >= 0]
+        if liburing is not None and self._sysfs_slots:
+            try:
+                self._sysfs_reader = _IoUringBatchReader(self._sysfs_slots)
+            except Exception as e:
+                logging.info("io_uring unavailable, falling back to pread: %s", e)
+        # Shared worker pool for get_all_metrics_threaded, so threads are not created per call
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sysmon")
+        # Memoized metric results: key -> (monotonic timestamp, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+
+    def close(self) -> None:
+        """
+        Releases the file descriptors and worker threads held by the monitor.
+        """
+        reader = getattr(self, '_sysfs_reader', None)
+        if reader is not None:
+            reader.close()
+            self._sysfs_reader = None
+        pool = getattr(self, '_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+        for attr in ('_cpu_temp_fd', '_gpu_temp_fd', '_net_dev_fd', '_stat_fd'):
+            fd = getattr(self, attr, -1)
+            if fd >= 0:
+                os.close(fd)
+                setattr(self, attr, -1)
+
+    def __del__(self):
+        self.close()
+
+    def _cached(self, key: str, ttl: float, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Returns the memoized result of `fn(*args)` under `key`, calling `fn` again once `ttl` seconds have passed.
+        """
+        current_time = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and current_time - entry[0] <= ttl:
+            return entry[1]
+        value = fn(*args)
+        self._cache[key] = (current_time, value)
+        return value
+
+    def _read_cpu_temperature(self) -> Optional[float]:
+        """
+        Reads the CPU temperature from the system file, bypassing the TTL cache.
+        """
+        try:
+            if self._cpu_temp_fd < 0:
+                raise FileNotFoundError(f"No such file: {CPU_TEMP_PATH}")
+            temp_str = os.pread(self._cpu_temp_fd, 32, 0)
+            return int(temp_str) / 1000.0  # sysfs reports integer millidegrees
+        except (OSError, ValueError) as e:
+            logging.error("Error reading CPU temperature: %s", e)
+            return None
+
+    def _read_temperatures_batched(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Reads the CPU and GPU temperatures in one io_uring submission, refreshing the CPU temperature cache.
+
+        Files without a descriptor, or whose batched read failed, fall back to the regular getters.
+        """
+        raw = dict(zip(self._sysfs_slots, self._sysfs_reader.read_all()))
+        temps = []
+        for fd in (self._cpu_temp_fd, self._gpu_temp_fd):
+            try:
+                temps.append(raw[fd] / 1000.0)  # sysfs reports integer millidegrees
+            except (KeyError, TypeError):
+                temps.append(None)
+        cpu_temp, gpu_temp = temps
+        if cpu_temp is None:
+            cpu_temp = self._read_cpu_temperature()
+        self._cpu_temperature = cpu_temp
+        self._cpu_temp_timestamp = time.monotonic()
+        if gpu_temp is None:
+            gpu_temp = self.get_gpu_temperature()
+        return cpu_temp, gpu_temp
 
     def get_cpu_temperature(self) -> Optional[float]:
         """
         Reads the CPU temperature from the system file.
 
+        The value is cached for `_cpu_temp_ttl` seconds; see the `cpu_temperature` property.
+
         Returns:
             float or None: The CPU temperature in Celsius if available, otherwise None.
 
         Raises:
             Exception: If an unexpected error occurs while reading the temperature.
         """
-        current_time = time.time()
-        if current_time - self._cpu_temp_timestamp > self._cpu_temp_ttl:
-            try:
-                temp_path = "/sys/class/thermal/thermal_zone0/temp"
-                with open(temp_path, "r") as f:
-                    temp_str = f.readline()
-                    temp_c = float(temp_str) / 1000.0
-                    self._cpu_temperature = temp_c
-                    self._cpu_temp_timestamp = current_time
-            except (FileNotFoundError, ValueError) as e:
-                logging.error(f"Error reading CPU temperature: {e}")
-                self._cpu_temperature = None
-        return self._cpu_temperature
+        return self.cpu_temperature
 
     async def get_cpu_temperature_async(self) -> Optional[float]:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_cpu_temperature)
+        """
+        Asynchronously gets the CPU temperature.
+
+        The sysfs read is a single non-blocking pread, so it runs directly in the coroutine
+        instead of hopping to a worker thread.
+        """
+        return self.get_cpu_temperature()
 
     def get_gpu_temperature(self) -> Optional[float]:
         """
         Attempts to read GPU temperature directly from system files before using external commands.
+
+        The `vcgencmd` fallback forks a process, so its result is cached for `_gpu_temp_ttl` seconds.
         """
         try:
-            temp_path = "/sys/class/thermal/thermal_zone1/temp"
-            if os.path.exists(temp_path):
-                with open(temp_path, "r") as f:
-                    temp_str = f.readline()
-                    temp_c = float(temp_str) / 1000.0
-                    return temp_c
+            if self._gpu_temp_fd >= 0:
+                temp_str = os.pread(self._gpu_temp_fd, 32, 0)
+                temp_c = int(temp_str) / 1000.0  # sysfs reports integer millidegrees
+                return temp_c
+            elif self._vcgencmd_path is None:
+                # Already reported once in __init__
+                return None
             else:
                 # Fallback to vcgencmd if the system file doesn't exist
-                output = subprocess.check_output(["vcgencmd", "measure_temp"]).decode()
-                temp_str = output.strip().split('=')[1].split("'")[0]
-                temp_c = float(temp_str)
-                return temp_c
+                current_time = time.monotonic()
+                if current_time - self._gpu_temp_timestamp > self._gpu_temp_ttl:
+                    # Stamp before forking so a failing vcgencmd is throttled as well
+                    self._gpu_temperature = None
+                    self._gpu_temp_timestamp = current_time
+                    output = subprocess.check_output([self._vcgencmd_path, "measure_temp"]).decode()
+                    temp_str = output.strip().split('=')[1].split("'")[0]
+                    self._gpu_temperature = float(temp_str)
+                return self._gpu_temperature
         except Exception as e:
-            logging.error(f"Error getting GPU temperature: {e}")
+            logging.error("Error getting GPU temperature: %s", e)
             return None
 
+    async def get_gpu_temperature_async(self) -> Optional[float]:
+        """
+        Asynchronously gets the GPU temperature.
+
+        The `vcgencmd` fallback forks a process, so the read is offloaded to a worker thread
+        to keep the event loop responsive.
+        """
+        return await asyncio.to_thread(self.get_gpu_temperature)
+
+    def _refresh_cpu(self) -> Tuple[float, List[float]]:
+        """
+        Returns (aggregate, per-core) CPU usage since the previous refresh.
+
+        Both values come from a single /proc/stat read that is reused for `CPU_SAMPLE_TTL` seconds,
+        so calling `get_cpu_usage` and `get_per_core_cpu_usage` back to back reads the file once.
+        Like `psutil.cpu_percent(interval=None)`, the values cover the time since the previous sample.
+        """
+        with self._cpu_lock:
+            current_time = time.monotonic()
+            sample = self._cpu_sample
+            if sample is not None and current_time - sample[0] <= CPU_SAMPLE_TTL:
+                return sample[1], sample[2]
+            if self._stat_fd < 0:
+                total = psutil.cpu_percent(interval=None)
+                per_core = psutil.cpu_percent(interval=None, percpu=True)
+            else:
+                times = _parse_proc_stat(_pread_all(self._stat_fd))
+                # A changed core count (hotplug) invalidates the baseline
+                previous = self._cpu_prev_times if len(self._cpu_prev_times) == len(times) else times
+                percents = [_busy_percent(prev, cur) for prev, cur in zip(previous, times)]
+                self._cpu_prev_times = times
+                total, per_core = percents[0], percents[1:]
+            self._cpu_sample = (current_time, total, per_core)
+            return total, per_core
+
     def get_cpu_usage(self) -> Optional[float]:
         """
         Returns the current CPU usage percentage.
@@ -100,19 +481,17 @@ class SystemMonitor:
         """
         try:
             # non-blocking
-            cpu_usage = psutil.cpu_percent(interval=None)
+            cpu_usage = self._refresh_cpu()[0]
             return cpu_usage
         except Exception as e:
-            logging.error(f"Error getting CPU usage: {e}")
+            logging.error("Error getting CPU usage: %s", e)
             return None
 
     async def get_cpu_usage_async(self) -> Optional[float]:
         """
         Asynchronously gets CPU usage.
         """
-        loop = asyncio.get_event_loop()
-        cpu_usage = await loop.run_in_executor(None, psutil.cpu_percent, None)
-        return cpu_usage
+        return await asyncio.to_thread(self.get_cpu_usage)
 
     def get_per_core_cpu_usage(self) -> Optional[List[float]]:
         """
@@ -126,10 +505,33 @@ class SystemMonitor:
         """
         try:
             # non blocking
-            per_core_usage = psutil.cpu_percent(interval=None, percpu=True)
+            per_core_usage = list(self._refresh_cpu()[1])
             return per_core_usage
         except Exception as e:
-            logging.error(f"Error getting per-core CPU usage: {e}")
+            logging.error("Error getting per-core CPU usage: %s", e)
+            return None
+
+    def get_per_core_cpu_usage_np(self) -> Optional["np.ndarray"]:
+        """
+        Returns the CPU usage percentage for each core as a NumPy array.
+
+        Useful for callers computing statistics (mean, std, hottest core) over many cores or
+        sample histories, which can then be reduced without converting a list first.
+
+        Returns:
+            numpy.ndarray or None: A float32 array of per-core CPU usage percentages,
+            or None if numpy is not installed or an error occurs.
+
+        Raises:
+            Exception: If an unexpected error occurs while retrieving per-core CPU usage.
+        """
+        if np is None:
+            logging.error("numpy is required for get_per_core_cpu_usage_np.")
+            return None
+        try:
+            return np.asarray(self._refresh_cpu()[1], dtype=np.float32)
+        except Exception as e:
+            logging.error("Error getting per-core CPU usage: %s", e)
             return None
 
     def get_cpu_frequency(self) -> Optional[float]:
@@ -150,50 +552,39 @@ class SystemMonitor:
                 logging.error("CPU frequency information not available.")
                 return None
         except Exception as e:
-            logging.error(f"Error getting CPU frequency: {e}")
+            logging.error("Error getting CPU frequency: %s", e)
             return None
 
-    def get_cpu_stats(self) -> Optional[Dict[str, Any]]:
+    def get_cpu_stats(self) -> Optional[CpuStats]:
         """
         Retrieves various CPU statistics in one call.
         """
         try:
             cpu_times = psutil.cpu_times_percent(interval=None)
-            stats = {
-                'user': cpu_times.user,
-                'system': cpu_times.system,
-                'idle': cpu_times.idle,
-                # Add more stats as needed
-            }
-            return stats
+            return CpuStats(cpu_times.user, cpu_times.system, cpu_times.idle)
         except Exception as e:
-            logging.error(f"Error getting CPU stats: {e}")
+            logging.error("Error getting CPU stats: %s", e)
             return None
 
-    def get_memory_info(self) -> Optional[Dict[str, float]]:
+    def get_memory_info(self) -> Optional[MemoryInfo]:
         """
         Returns memory usage statistics.
 
         Returns:
-            Dict[str, float] or None: A dictionary containing total, used, free memory in MB and usage percentage,
-            or None if an error occurs.
+            MemoryInfo or None: A named tuple containing total, used, free memory in MB and usage percentage,
+            or None if an error occurs. Use `as_dict()` if a dictionary is needed.
 
         Raises:
             Exception: If an unexpected error occurs while retrieving memory information.
         """
         try:
             mem = psutil.virtual_memory()
-            return {
-                'total': round(mem.total / (1024 ** 2), 2),
-                'used': round(mem.used / (1024 ** 2), 2),
-                'free': round(mem.available / (1024 ** 2), 2),
-                'percent': round(mem.percent, 2)
-            }
+            return MemoryInfo(mem.total * _INV_MB, mem.used * _INV_MB, mem.available * _INV_MB, mem.percent)
         except Exception as e:
-            logging.error(f"Error getting memory info: {e}")
+            logging.error("Error getting memory info: %s", e)
             return None
 
-    def get_disk_usage(self, path: str = '/') -> Optional[Dict[str, float]]:
+    def get_disk_usage(self, path: str = '/') -> Optional[DiskUsage]:
         """
         Returns disk usage statistics for the specified path.
 
@@ -201,26 +592,21 @@ class SystemMonitor:
             path (str): The filesystem path to check. Defaults to '/'.
 
         Returns:
-            Dict[str, float] or None: A dictionary containing total, used, free disk space in GB and usage percentage,
-            or None if an error occurs.
+            DiskUsage or None: A named tuple containing total, used, free disk space in GB and usage percentage,
+            or None if an error occurs. Use `as_dict()` if a dictionary is needed.
 
         Raises:
             Exception: If an unexpected error occurs while retrieving disk usage.
         """
         try:
-            if os.path.exists(path):
-                disk = psutil.disk_usage(path)
-                return {
-                    'total': disk.total / (1024 ** 3),  # Convert bytes to GB
-                    'used': disk.used / (1024 ** 3),
-                    'free': disk.free / (1024 ** 3),
-                    'percent': disk.percent
-                }
-            else:
-                logging.error(f"Disk path does not exist: {path}")
-                return None
+            # statvfs already fails with ENOENT, so there is no separate existence check
+            disk = psutil.disk_usage(path)
+            return DiskUsage(disk.total * _INV_GB, disk.used * _INV_GB, disk.free * _INV_GB, disk.percent)
+        except FileNotFoundError as e:
+            logging.error("Disk path does not exist: %s: %s", path, e)
+            return None
         except Exception as e:
-            logging.error(f"Error getting disk usage for {path}: {e}")
+            logging.error("Error getting disk usage for %s: %s", path, e)
             return None
 
     def get_network_stats(self) -> Optional[Dict[str, Tuple[float, float]]]:
@@ -235,13 +621,15 @@ class SystemMonitor:
             Exception: If an unexpected error occurs while retrieving network statistics.
         """
         try:
-            stats = psutil.net_io_counters(pernic=True)
-            network_data = {}
-            for iface, data in stats.items():
-                network_data[iface] = (data.bytes_sent, data.bytes_recv)
-            return network_data
+            if self._net_dev_fd < 0:
+                # No /proc/net/dev (non-Linux host); let psutil find the counters
+                stats = psutil.net_io_counters(pernic=True)
+                return {iface: (data.bytes_sent, data.bytes_recv) for iface, data in stats.items()}
+            with self._net_dev_lock:
+                data = _pread_all(self._net_dev_fd)
+            return _parse_proc_net_dev(data)
         except Exception as e:
-            logging.error(f"Error getting network stats: {e}")
+            logging.error("Error getting network stats: %s", e)
             return None
 
     def get_uptime(self) -> Optional[float]:
@@ -258,7 +646,7 @@ class SystemMonitor:
             uptime = psutil.boot_time()
             return uptime
         except Exception as e:
-            logging.error(f"Error getting system uptime: {e}")
+            logging.error("Error getting system uptime: %s", e)
             return None
 
     def get_load_average(self) -> Optional[Tuple[float, float, float]]:
@@ -276,7 +664,7 @@ class SystemMonitor:
             load_avg = os.getloadavg()
             return load_avg
         except (AttributeError, OSError) as e:
-            logging.error(f"Error getting load average: {e}")
+            logging.error("Error getting load average: %s", e)
             return None
 
     def get_process_count(self) -> Optional[int]:
@@ -290,18 +678,20 @@ class SystemMonitor:
             Exception: If an unexpected error occurs while retrieving process count.
         """
         try:
-            process_count = len(psutil.pids())
+            # Count the numeric /proc entries by name only; scandir needs no per-entry stat
+            with os.scandir('/proc') as entries:
+                process_count = sum(1 for entry in entries if entry.name.isdigit())
             return process_count
         except Exception as e:
-            logging.error(f"Error getting process count: {e}")
+            logging.error("Error getting process count: %s", e)
             return None
 
-    def get_battery_status(self) -> Optional[Dict[str, float]]:
+    def get_battery_status(self) -> Optional[BatteryStatus]:
         """
         Returns battery status information.
 
         Returns:
-            Dict[str, float] or None: A dictionary containing battery percentage, seconds left,
+            BatteryStatus or None: A named tuple containing battery percentage, seconds left,
             and power plugged status, or None if battery information is not available.
 
         Raises:
@@ -310,16 +700,12 @@ class SystemMonitor:
         try:
             battery = psutil.sensors_battery()
             if battery:
-                return {
-                    'percent': battery.percent,
-                    'secsleft': battery.secsleft,
-                    'power_plugged': battery.power_plugged
-                }
+                return BatteryStatus(battery.percent, battery.secsleft, battery.power_plugged)
             else:
                 logging.info("Battery information not available.")
                 return None
         except Exception as e:
-            logging.error(f"Error getting battery status: {e}")
+            logging.error("Error getting battery status: %s", e)
             return None
 
     def get_fan_speed(self) -> Optional[int]:
@@ -353,89 +739,88 @@ class SystemMonitor:
     def get_all_metrics(self) -> Dict[str, Any]:
         """
         Collects all system metrics at once to reduce overhead.
+
+        psutil results are memoized for `FAST_METRIC_TTL` seconds, so polling
+        faster than the metrics change does not re-parse `/proc`. When `liburing` is installed, the sysfs
+        temperature files are read together in a single io_uring submission whenever the CPU temperature TTL
+        has expired.
         """
         metrics = {}
         try:
-            metrics['cpu_temp'] = self.get_cpu_temperature()
-            metrics['cpu_usage'] = psutil.cpu_percent(interval=None)
-            cpu_freq = psutil.cpu_freq()
+            # Batch only when the CPU temperature is due, so io_uring does not change how often it is read
+            cpu_temp_expired = time.monotonic() - self._cpu_temp_timestamp > self._cpu_temp_ttl
+            if self._sysfs_reader is not None and cpu_temp_expired:
+                metrics['cpu_temp'], metrics['gpu_temp'] = self._read_temperatures_batched()
+            else:
+                metrics['cpu_temp'] = self.get_cpu_temperature()
+                metrics['gpu_temp'] = self.get_gpu_temperature()
+            metrics['cpu_usage'] = self._cached('cpu_usage', FAST_METRIC_TTL, self.get_cpu_usage)
+            cpu_freq = self._cached('cpu_freq', FAST_METRIC_TTL, psutil.cpu_freq)
             metrics['cpu_freq'] = cpu_freq.current if cpu_freq else None
 
-            mem = psutil.virtual_memory()
-            metrics['memory'] = {
-                'total': mem.total / (1024 ** 2),
-                'used': mem.used / (1024 ** 2),
-                'free': mem.available / (1024 ** 2),
-                'percent': mem.percent
-            }
-
-            disk = psutil.disk_usage('/')
-            metrics['disk'] = {
-                'total': disk.total / (1024 ** 3),
-                'used': disk.used / (1024 ** 3),
-                'free': disk.free / (1024 ** 3),
-                'percent': disk.percent
-            }
+            mem = self._cached('memory', FAST_METRIC_TTL, psutil.virtual_memory)
+            metrics['memory'] = MemoryInfo(mem.total * _INV_MB, mem.used * _INV_MB, mem.available * _INV_MB, mem.percent)
+
+            # One statvfs returns totals and usage together, so the whole result shares the fast TTL
+            disk = self._cached('disk:/', FAST_METRIC_TTL, psutil.disk_usage, '/')
+            metrics['disk'] = DiskUsage(disk.total * _INV_GB, disk.used * _INV_GB, disk.free * _INV_GB, disk.percent)
 
             # Add more metrics as needed
         except Exception as e:
-            logging.error(f"Error collecting metrics: {e}")
+            logging.error("Error collecting metrics: %s", e)
 
         return metrics
 
 
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _compile_metrics_fn(keys: Tuple[str, ...]) -> Callable[['SystemMonitor'], Dict[str, Any]]:
+        """
+        Builds a collector for a fixed tuple of metric names, so repeated requests skip the lookups.
+        """
+        getters = [(key, methodcaller(SystemMonitor._METRIC_DISPATCH[key]))
+                   for key in keys if key in SystemMonitor._METRIC_DISPATCH]
+
+        def collect(monitor: 'SystemMonitor') -> Dict[str, Any]:
+            return {key: getter(monitor) for key, getter in getters}
+
+        return collect
+
     def get_metrics(self, metrics_list: List[str]) -> Dict[str, Any]:
         """
         Collects specified system metrics.
+
+        Supported names are the keys of `_METRIC_DISPATCH`; unknown names are ignored.
         """
-        metrics = {}
-        for metric in metrics_list:
-            if metric == 'cpu_temp':
-                metrics['cpu_temp'] = self.get_cpu_temperature()
-            elif metric == 'cpu_usage':
-                metrics['cpu_usage'] = self.get_cpu_usage()
-            # Add other metrics as needed
-        return metrics
+        return self._compile_metrics_fn(tuple(metrics_list))(self)
 
     async def get_all_metrics_async(self) -> Dict[str, Any]:
         """
         Asynchronously collects all system metrics.
+
+        The sysfs and /proc reads are fanned out concurrently, so the sweep takes about as long
+        as the slowest single read rather than the sum of all of them.
         """
-        tasks = [
+        keys = ('cpu_temp', 'gpu_temp', 'cpu_usage', 'cpu_freq', 'memory', 'disk', 'network')
+        results = await asyncio.gather(
             self.get_cpu_temperature_async(),
+            self.get_gpu_temperature_async(),
             self.get_cpu_usage_async(),
-            # Add other async metric methods
-        ]
-        results = await asyncio.gather(*tasks)
-        metrics = {
-            'cpu_temp': results[0],
-            'cpu_usage': results[1],
-            # Map other results
-        }
-        return metrics
+            asyncio.to_thread(self.get_cpu_frequency),
+            asyncio.to_thread(self.get_memory_info),
+            asyncio.to_thread(self.get_disk_usage, '/'),
+            asyncio.to_thread(self.get_network_stats),
+        )
+        return dict(zip(keys, results))
 
     def get_all_metrics_threaded(self) -> Dict[str, Any]:
         """
         Collects all system metrics using threads.
         """
-        metrics = {}
-
-        def collect_cpu_temp():
-            metrics['cpu_temp'] = self.get_cpu_temperature()
-
-        def collect_cpu_usage():
-            metrics['cpu_usage'] = self.get_cpu_usage()
-
-        threads = [
-            Thread(target=collect_cpu_temp),
-            Thread(target=collect_cpu_usage),
-            # Add other metric collection threads
-        ]
-
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
-
-        return metrics
+        futures = {
+            'cpu_temp': self._pool.submit(self.get_cpu_temperature),
+            'cpu_usage': self._pool.submit(self.get_cpu_usage),
+            # Submit other metric collectors
+        }
+        return {key: future.result() for key, future in futures.items()}
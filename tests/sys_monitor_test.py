@@ -1,8 +1,18 @@
+import os
+import tempfile
 import unittest
+import subprocess
+from unittest import mock
 import asyncio
-from pi_system_monitor.sys_monitor import SystemMonitor
+from pi_system_monitor import sys_monitor
+from pi_system_monitor.sys_monitor import SystemMonitor, CpuStats, MemoryInfo, DiskUsage, BatteryStatus
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class TestSystemMonitor(unittest.TestCase):
 
     def setUp(self):
@@ -46,6 +56,35 @@ class TestSystemMonitor(unittest.TestCase):
         else:
             self.assertIsNone(temp)
 
+    def test_get_gpu_temperature_vcgencmd_failure_throttled(self):
+        self.monitor.close()  # Drop any thermal_zone1 descriptor to force the vcgencmd fallback
+        self.monitor._vcgencmd_path = '/usr/bin/vcgencmd'
+        error = subprocess.CalledProcessError(255, ['vcgencmd', 'measure_temp'])
+        with mock.patch('subprocess.check_output', side_effect=error) as check_output:
+            for _ in range(5):
+                self.assertIsNone(self.monitor.get_gpu_temperature())
+        # A failed run is cached for the TTL just like a successful one
+        self.assertEqual(check_output.call_count, 1)
+
+    def test_get_gpu_temperature_unavailable_is_quiet(self):
+        self.monitor.close()  # Drop any thermal_zone1 descriptor
+        self.monitor._vcgencmd_path = None
+        with mock.patch('logging.error') as log_error:
+            self.assertIsNone(self.monitor.get_gpu_temperature())
+            self.monitor.get_all_metrics()
+        self.assertFalse([call for call in log_error.call_args_list if 'GPU' in str(call)])
+
+    def test_get_gpu_temperature_async(self):
+        async def run_test():
+            temp = await self.monitor.get_gpu_temperature_async()
+            if temp is not None:
+                self.assertIsInstance(temp, float)
+                self.assertGreaterEqual(temp, -20)
+                self.assertLessEqual(temp, 150)
+            else:
+                self.assertIsNone(temp)
+        asyncio.run(run_test())
+
     def test_get_cpu_usage(self):
         usage = self.monitor.get_cpu_usage()
         self.assertIsNotNone(usage)
@@ -72,6 +111,31 @@ class TestSystemMonitor(unittest.TestCase):
             self.assertGreaterEqual(usage, 0)
             self.assertLessEqual(usage, 100)
 
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_get_per_core_cpu_usage_np(self):
+        usage = self.monitor.get_per_core_cpu_usage_np()
+        self.assertIsNotNone(usage)
+        self.assertIsInstance(usage, np.ndarray)
+        self.assertEqual(usage.dtype, np.float32)
+        self.assertGreater(usage.size, 0)
+        self.assertTrue(((usage >= 0) & (usage <= 100)).all())
+
+    def test_proc_stat_cpu_usage(self):
+        before = sys_monitor._parse_proc_stat(
+            b"cpu  100 0 100 700 100 0 0 0 0 0\n"
+            b"cpu0 50 0 50 350 50 0 0 0 0 0\n"
+            b"cpu1 50 0 50 350 50 0 0 0 0 0\n"
+            b"intr 12345\n")
+        after = sys_monitor._parse_proc_stat(
+            b"cpu  200 0 200 1200 100 0 0 0 50 0\n"
+            b"cpu0 150 0 50 400 50 0 0 0 50 0\n"
+            b"cpu1 50 0 150 800 50 0 0 0 0 0\n")
+        self.assertEqual(len(before), 3)
+        # guest time is already part of user time and must not be counted twice
+        self.assertEqual(after[0], (400, 1700))
+        usage = [sys_monitor._busy_percent(prev, cur) for prev, cur in zip(before, after)]
+        self.assertEqual(usage, [28.6, 66.7, 18.2])
+
     def test_get_cpu_frequency(self):
         freq = self.monitor.get_cpu_frequency()
         if freq is not None:
@@ -84,37 +148,41 @@ class TestSystemMonitor(unittest.TestCase):
     def test_get_cpu_stats(self):
         stats = self.monitor.get_cpu_stats()
         if stats is not None:
-            self.assertIsInstance(stats, dict)
-            self.assertIn('user', stats)
-            self.assertIn('system', stats)
-            self.assertIn('idle', stats)
+            self.assertIsInstance(stats, CpuStats)
             for key in ['user', 'system', 'idle']:
-                self.assertIsInstance(stats[key], float)
-                self.assertGreaterEqual(stats[key], 0)
-                self.assertLessEqual(stats[key], 100)
+                self.assertIsInstance(getattr(stats, key), float)
+                self.assertGreaterEqual(getattr(stats, key), 0)
+                self.assertLessEqual(getattr(stats, key), 100)
+            self.assertEqual(stats.as_dict(), {'user': stats.user, 'system': stats.system, 'idle': stats.idle})
         else:
             self.assertIsNone(stats)
 
     def test_get_memory_info(self):
         mem_info = self.monitor.get_memory_info()
         self.assertIsNotNone(mem_info)
-        self.assertIsInstance(mem_info, dict)
+        self.assertIsInstance(mem_info, MemoryInfo)
+        mem_dict = mem_info.as_dict()
+        self.assertIsInstance(mem_dict, dict)
         for key in ['total', 'used', 'free', 'percent']:
-            self.assertIn(key, mem_info)
-            self.assertIsInstance(mem_info[key], float)
-            self.assertGreaterEqual(mem_info[key], 0)
+            self.assertIn(key, mem_dict)
+            self.assertIsInstance(getattr(mem_info, key), float)
+            self.assertGreaterEqual(getattr(mem_info, key), 0)
 
     def test_get_disk_usage(self):
         disk_info = self.monitor.get_disk_usage()
         if disk_info is not None:
-            self.assertIsInstance(disk_info, dict)
+            self.assertIsInstance(disk_info, DiskUsage)
+            disk_dict = disk_info.as_dict()
             for key in ['total', 'used', 'free', 'percent']:
-                self.assertIn(key, disk_info)
-                self.assertIsInstance(disk_info[key], float)
-                self.assertGreaterEqual(disk_info[key], 0)
+                self.assertIn(key, disk_dict)
+                self.assertIsInstance(getattr(disk_info, key), float)
+                self.assertGreaterEqual(getattr(disk_info, key), 0)
         else:
             self.assertIsNone(disk_info)
 
+    def test_get_disk_usage_missing_path(self):
+        self.assertIsNone(self.monitor.get_disk_usage('/nonexistent/path'))
+
     def test_get_network_stats(self):
         net_stats = self.monitor.get_network_stats()
         if net_stats is not None:
@@ -130,6 +198,20 @@ class TestSystemMonitor(unittest.TestCase):
         else:
             self.assertIsNone(net_stats)
 
+    def test_parse_proc_net_dev(self):
+        data = (
+            b"Inter-|   Receive                                                |  Transmit\n"
+            b" face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
+            b"    lo:    1234      10    0    0    0     0          0         0     1234      10    0    0    0     0       0          0\n"
+            b"eth0:1234567890123 900    0    0    0     0          0         0 98765     40    0    0    0     0       0          0\n"
+            b"veth1a2b:       0       0    0    0    0     0          0         0        7       1    0    0    0     0       0          0\n"
+        )
+        self.assertEqual(sys_monitor._parse_proc_net_dev(data), {
+            'lo': (1234, 1234),
+            'eth0': (98765, 1234567890123),
+            'veth1a2b': (7, 0),
+        })
+
     def test_get_uptime(self):
         uptime = self.monitor.get_uptime()
         if uptime is not None:
@@ -160,15 +242,12 @@ class TestSystemMonitor(unittest.TestCase):
     def test_get_battery_status(self):
         battery_status = self.monitor.get_battery_status()
         if battery_status is not None:
-            self.assertIsInstance(battery_status, dict)
-            self.assertIn('percent', battery_status)
-            self.assertIn('secsleft', battery_status)
-            self.assertIn('power_plugged', battery_status)
-            self.assertIsInstance(battery_status['percent'], float)
-            self.assertGreaterEqual(battery_status['percent'], 0)
-            self.assertLessEqual(battery_status['percent'], 100)
-            self.assertIsInstance(battery_status['secsleft'], (float, int))
-            self.assertIsInstance(battery_status['power_plugged'], bool)
+            self.assertIsInstance(battery_status, BatteryStatus)
+            self.assertIsInstance(battery_status.percent, float)
+            self.assertGreaterEqual(battery_status.percent, 0)
+            self.assertLessEqual(battery_status.percent, 100)
+            self.assertIsInstance(battery_status.secsleft, (float, int))
+            self.assertIsInstance(battery_status.power_plugged, bool)
         else:
             self.assertIsNone(battery_status)
 
@@ -184,10 +263,112 @@ class TestSystemMonitor(unittest.TestCase):
         metrics = self.monitor.get_all_metrics()
         self.assertIsInstance(metrics, dict)
         # Check for expected keys
-        expected_keys = ['cpu_temp', 'cpu_usage', 'cpu_freq', 'memory', 'disk']
+        expected_keys = ['cpu_temp', 'gpu_temp', 'cpu_usage', 'cpu_freq', 'memory', 'disk']
         for key in expected_keys:
             self.assertIn(key, metrics)
 
+    def test_get_all_metrics_cached(self):
+        with mock.patch('psutil.virtual_memory', wraps=sys_monitor.psutil.virtual_memory) as virtual_memory, \
+                mock.patch('psutil.disk_usage', wraps=sys_monitor.psutil.disk_usage) as disk_usage:
+            first = self.monitor.get_all_metrics()
+            second = self.monitor.get_all_metrics()
+        # Back-to-back calls fall within the TTL and reuse the memoized psutil results
+        self.assertEqual(virtual_memory.call_count, 1)
+        self.assertEqual(disk_usage.call_count, 1)
+        self.assertEqual(first['memory'], second['memory'])
+        self.assertEqual(first['disk'], second['disk'])
+
+    @unittest.skipIf(sys_monitor.liburing is None, "liburing not installed")
+    def test_io_uring_batch_reader(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            fds = []
+            for name, value in (('zone0', b'45000\n'), ('zone1', b'51250\n')):
+                path = os.path.join(tmp, name)
+                with open(path, 'wb') as f:
+                    f.write(value)
+                fds.append(os.open(path, os.O_RDONLY))
+            try:
+                try:
+                    reader = sys_monitor._IoUringBatchReader(fds)
+                except OSError as e:
+                    self.skipTest(f"io_uring not permitted: {e}")
+                try:
+                    first = reader.read_all()
+                    self.assertEqual(first, [45000, 51250])
+                    with open(os.path.join(tmp, 'zone0'), 'wb') as f:
+                        f.write(b'99000\n')
+                    # Reads restart at offset 0, and earlier results do not alias the reused buffers
+                    self.assertEqual(reader.read_all(), [99000, 51250])
+                    self.assertEqual(first, [45000, 51250])
+                finally:
+                    reader.close()
+            finally:
+                for fd in fds:
+                    os.close(fd)
+
+    @unittest.skipIf(sys_monitor.liburing is None, "liburing not installed")
+    def test_io_uring_batch_reader_wraps_ring(self):
+        # Three files do not divide the completion ring, so later batches wrap around its end
+        with tempfile.TemporaryDirectory() as tmp:
+            fds = []
+            for index in range(3):
+                path = os.path.join(tmp, f'zone{index}')
+                with open(path, 'wb') as f:
+                    f.write(b'%d\n' % ((index + 1) * 1000))
+                fds.append(os.open(path, os.O_RDONLY))
+            try:
+                try:
+                    reader = sys_monitor._IoUringBatchReader(fds)
+                except OSError as e:
+                    self.skipTest(f"io_uring not permitted: {e}")
+                try:
+                    for _ in range(8):
+                        self.assertEqual(reader.read_all(), [1000, 2000, 3000])
+                finally:
+                    reader.close()
+            finally:
+                for fd in fds:
+                    os.close(fd)
+
+    def _monitor_with_temp_files(self, tmp):
+        paths = {}
+        for name, value in (('zone0', b'45000\n'), ('zone1', b'51250\n')):
+            paths[name] = os.path.join(tmp, name)
+            with open(paths[name], 'wb') as f:
+                f.write(value)
+        with mock.patch.object(sys_monitor, 'CPU_TEMP_PATH', paths['zone0']), \
+                mock.patch.object(sys_monitor, 'GPU_TEMP_PATH', paths['zone1']):
+            monitor = SystemMonitor()
+        self.addCleanup(monitor.close)
+        if monitor._sysfs_reader is None:
+            self.skipTest("io_uring not permitted")
+        return monitor
+
+    @unittest.skipIf(sys_monitor.liburing is None, "liburing not installed")
+    def test_get_all_metrics_batched_temperatures(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = self._monitor_with_temp_files(tmp)
+            with mock.patch.object(monitor._sysfs_reader, 'read_all',
+                                   wraps=monitor._sysfs_reader.read_all) as read_all:
+                metrics = monitor.get_all_metrics()
+                self.assertEqual(metrics['cpu_temp'], 45.0)
+                self.assertEqual(metrics['gpu_temp'], 51.25)
+                # Within the CPU temperature TTL the batch is not resubmitted
+                metrics = monitor.get_all_metrics()
+                self.assertEqual(metrics['cpu_temp'], 45.0)
+                self.assertEqual(metrics['gpu_temp'], 51.25)
+            self.assertEqual(read_all.call_count, 1)
+
+    @unittest.skipIf(sys_monitor.liburing is None, "liburing not installed")
+    def test_get_all_metrics_batched_slot_failure(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            monitor = self._monitor_with_temp_files(tmp)
+            # Failed slots fall back to the pread getters
+            with mock.patch.object(monitor._sysfs_reader, 'read_all', return_value=[None, None]):
+                metrics = monitor.get_all_metrics()
+            self.assertEqual(metrics['cpu_temp'], 45.0)
+            self.assertEqual(metrics['gpu_temp'], 51.25)
+
     def test_get_metrics(self):
         metrics_list = ['cpu_temp', 'cpu_usage']
         metrics = self.monitor.get_metrics(metrics_list)
@@ -195,19 +376,43 @@ class TestSystemMonitor(unittest.TestCase):
         for metric in metrics_list:
             self.assertIn(metric, metrics)
 
+    def test_get_metrics_all_names(self):
+        metrics_list = list(SystemMonitor._METRIC_DISPATCH) + ['unknown_metric']
+        metrics = self.monitor.get_metrics(metrics_list)
+        self.assertEqual(set(metrics), set(SystemMonitor._METRIC_DISPATCH))
+
+    def test_get_metrics_honours_overrides(self):
+        with mock.patch.object(self.monitor, 'get_cpu_temperature', return_value=99.0):
+            self.assertEqual(self.monitor.get_metrics(['cpu_temp']), {'cpu_temp': 99.0})
+
     def test_get_all_metrics_async(self):
         async def run_test():
             metrics = await self.monitor.get_all_metrics_async()
             self.assertIsInstance(metrics, dict)
-            self.assertIn('cpu_temp', metrics)
-            self.assertIn('cpu_usage', metrics)
+            for key in ['cpu_temp', 'gpu_temp', 'cpu_usage', 'cpu_freq', 'memory', 'disk', 'network']:
+                self.assertIn(key, metrics)
         asyncio.run(run_test())
 
+    def test_async_methods_avoid_deprecated_loop_lookup(self):
+        async def run_test():
+            await self.monitor.get_cpu_temperature_async()
+            await self.monitor.get_gpu_temperature_async()
+            await self.monitor.get_cpu_usage_async()
+            await self.monitor.get_all_metrics_async()
+        # asyncio.run itself does not call get_event_loop, so any call comes from the monitor
+        with mock.patch('asyncio.get_event_loop', side_effect=AssertionError("use asyncio.to_thread")):
+            asyncio.run(run_test())
+
     def test_get_all_metrics_threaded(self):
         metrics = self.monitor.get_all_metrics_threaded()
         self.assertIsInstance(metrics, dict)
         self.assertIn('cpu_temp', metrics)
         self.assertIn('cpu_usage', metrics)
 
+    def test_close(self):
+        self.monitor.close()
+        self.monitor.close()  # Closing twice must be harmless
+        self.assertIsNone(self.monitor.get_cpu_temperature())
+
 if __name__ == '__main__':
     unittest.main()